@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from .models import Session, Shot
 
 @admin.register(Session)
@@ -7,8 +8,12 @@ class SessionAdmin(admin.ModelAdmin):
     list_filter = ['created_at']
     search_fields = ['name']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_shot_count=Count('shots'))
+    
     def shot_count(self, obj):
-        return obj.shots.count()
+        return obj._shot_count
+    shot_count.admin_order_field = '_shot_count'
 
 @admin.register(Shot)
 class ShotAdmin(admin.ModelAdmin):
@@ -17,7 +22,7 @@ class ShotAdmin(admin.ModelAdmin):
     readonly_fields = ['timestamp', 'image']
     fieldsets = (
         ('Basic Info', {
-            'fields': ('session', 'timestamp', 'image', 'processed', 'confidence_score', 'processing_errors')
+            'fields': ('session', 'timestamp', 'image', 'processed', 'confidence_score', 'processing_errors', 'raw_text')
         }),
         ('Basic Data', {
             'fields': ('ball_speed', 'club_head_speed', 'carry_distance', 'total_distance')
@@ -28,3 +33,7 @@ class ShotAdmin(admin.ModelAdmin):
                       'ball_height', 'descent_angle', 'apex_height', 'hang_time', 'offline')
         }),
     )
+    
+    def get_queryset(self, request):
+        # Skip large text columns the list doesn't show; processing_errors can hold long tracebacks
+        return super().get_queryset(request).defer('processing_errors', 'raw_text', 'session__notes')
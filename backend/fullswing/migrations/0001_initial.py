@@ -0,0 +1,56 @@
+# Generated by Django 5.0.1 on 2026-10-15 17:10
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Session',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('notes', models.TextField(blank=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Shot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('timestamp', models.DateTimeField(default=django.utils.timezone.now)),
+                ('image', models.ImageField(upload_to='shots/')),
+                ('ball_speed', models.FloatField(blank=True, null=True)),
+                ('club_head_speed', models.FloatField(blank=True, null=True)),
+                ('carry_distance', models.FloatField(blank=True, null=True)),
+                ('total_distance', models.FloatField(blank=True, null=True)),
+                ('smash_factor', models.FloatField(blank=True, null=True)),
+                ('launch_angle', models.FloatField(blank=True, null=True)),
+                ('spin_rate', models.FloatField(blank=True, null=True)),
+                ('side_spin', models.FloatField(blank=True, null=True)),
+                ('angle_of_attack', models.FloatField(blank=True, null=True)),
+                ('club_path', models.FloatField(blank=True, null=True)),
+                ('face_angle', models.FloatField(blank=True, null=True)),
+                ('dynamic_loft', models.FloatField(blank=True, null=True)),
+                ('impact_height', models.FloatField(blank=True, null=True)),
+                ('impact_toe', models.FloatField(blank=True, null=True)),
+                ('ball_height', models.FloatField(blank=True, null=True)),
+                ('descent_angle', models.FloatField(blank=True, null=True)),
+                ('apex_height', models.FloatField(blank=True, null=True)),
+                ('hang_time', models.FloatField(blank=True, null=True)),
+                ('offline', models.FloatField(blank=True, null=True)),
+                ('processed', models.BooleanField(default=False)),
+                ('processing_errors', models.TextField(blank=True)),
+                ('confidence_score', models.FloatField(blank=True, null=True)),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shots', to='fullswing.session')),
+            ],
+        ),
+    ]
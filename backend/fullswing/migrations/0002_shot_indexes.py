@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-15 17:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fullswing', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='shot',
+            index=models.Index(fields=['session', '-timestamp'], name='fullswing_s_session_008ef7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shot',
+            index=models.Index(fields=['processed'], name='fullswing_s_process_7a1b02_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-15 17:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fullswing', '0002_shot_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='shot',
+            name='raw_text',
+            field=models.TextField(blank=True),
+        ),
+    ]
@@ -40,7 +40,15 @@ class Shot(models.Model):
     # Processing metadata
     processed = models.BooleanField(default=False)
     processing_errors = models.TextField(blank=True)
+    raw_text = models.TextField(blank=True)
     confidence_score = models.FloatField(null=True, blank=True)
     
+    class Meta:
+        indexes = [
+            # Serves session_shots' filter on session ordered by newest first
+            models.Index(fields=['session', '-timestamp']),
+            models.Index(fields=['processed']),
+        ]
+    
     def __str__(self):
         return f"Shot {self.id} - {self.timestamp.strftime('%H:%M:%S')}"
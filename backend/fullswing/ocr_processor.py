@@ -1,95 +1,208 @@
 import cv2
 import numpy as np
-import pytesseract
 import re
-from typing import Dict, Optional, Tuple
-from PIL import Image
+import threading
+from typing import Dict, List, Optional, Tuple
+from bisect import bisect_right
+from tesserocr import PyTessBaseAPI, PSM, OEM, RIL, iterate_level
+
+# Make sure OpenCV dispatches to its SIMD-optimized kernels
+cv2.setUseOptimized(True)
+
+# Characters tesseract may emit for Full Swing readouts
+CHAR_WHITELIST = '0123456789.-+mph°ft/s'
+
+# Applied once when a thread's API is created, never per image. Readouts aren't
+# dictionary words, so skip loading the word lists as well.
+TESSERACT_VARIABLES = {
+    'tessedit_char_whitelist': CHAR_WHITELIST,
+    'load_system_dawg': 'F',
+    'load_freq_dawg': 'F',
+}
+
+# Longest side images are shrunk to before preprocessing; displays need far less than 12MP
+MAX_IMAGE_DIMENSION = 1600
+
+# Blank rows between panels when stacking them into one strip for a single OCR pass
+STRIP_GAP = 20
+
+# OLED readout panels as (x, y, width, height) fractions of the image. Not yet
+# calibrated against a real capture (adjust based on your display layout); OLED
+# processing falls back to reading the whole image when panels come back empty.
+OLED_ROIS = {
+    'ball_speed': (0.0, 0.0, 0.5, 0.5),
+    'club_head_speed': (0.5, 0.0, 0.5, 0.5),
+    'carry_distance': (0.0, 0.5, 0.5, 0.5),
+    'total_distance': (0.5, 0.5, 0.5, 0.5),
+}
+
+# Tesseract APIs are not thread-safe, so each worker thread keeps its own
+_local = threading.local()
+
+def get_tesseract_api() -> PyTessBaseAPI:
+    """Return this thread's tesseract API, loading the LSTM model on first use"""
+    api = getattr(_local, 'api', None)
+    if api is None:
+        # Both the iPad display and the stacked OLED panels read as a uniform block of text
+        api = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY, variables=TESSERACT_VARIABLES)
+        _local.api = api
+    return api
 
 class FullSwingOCR:
+    # Any number (including negative), optionally followed by a unit
+    NUMBER_PATTERN = re.compile(r'(?P<value>-?\d+\.?\d*)\s*(?P<unit>mph|ft|°|rpm|/s)?', re.IGNORECASE)
+    
+    # Letters tesseract commonly confuses with digits
+    OCR_FIXES = str.maketrans({'O': '0', 'o': '0', 'l': '1', 'I': '1'})
+    
     def __init__(self):
-        # Configure tesseract for better number recognition
-        self.config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789.-+mph°ft/s'
+        # Reuse the resident tesseract model instead of spawning a process per image
+        self.api = get_tesseract_api()
     
-    def preprocess_image(self, image_path: str) -> np.ndarray:
-        """Preprocess image for better OCR accuracy"""
-        # Read image
-        img = cv2.imread(image_path)
+    def decode_image(self, image_data: bytes) -> np.ndarray:
+        """Decode uploaded image bytes without a round-trip through disk"""
+        frame = cv2.imdecode(np.frombuffer(image_data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if frame is None:
+            raise ValueError('Could not decode image')
+        return frame
+    
+    def preprocess_array(self, frame: np.ndarray, display_type: str = 'oled') -> np.ndarray:
+        """Preprocess decoded BGR image for better OCR accuracy"""
+        height, width = frame.shape[:2]
+        
+        # Shrink large phone photos first; every later step scales with pixel count
+        scale = MAX_IMAGE_DIMENSION / max(height, width)
+        if scale < 1:
+            frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            height, width = frame.shape[:2]
+        
+        # Work on a UMat so OpenCV's transparent API can keep the pipeline on OpenCL when available
+        img = cv2.UMat(frame)
         
         # Convert to grayscale
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
         
-        # Apply bilateral filter to reduce noise while keeping edges sharp
-        filtered = cv2.bilateralFilter(gray, 9, 75, 75)
+        # Light Gaussian blur to reduce noise; digits on a flat background don't need
+        # the much costlier edge-preserving bilateral filter
+        filtered = cv2.GaussianBlur(gray, (3, 3), 0)
         
-        # Apply adaptive threshold
-        thresh = cv2.adaptiveThreshold(
-            filtered, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-        )
+        if display_type == 'oled':
+            # Bright digits on a uniformly dark OLED separate with a single global Otsu
+            # threshold; invert so tesseract gets dark text on a light background
+            _, thresh = cv2.threshold(filtered, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        else:
+            # Apply adaptive threshold to cope with the iPad's uneven backlight
+            thresh = cv2.adaptiveThreshold(
+                filtered, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+            )
         
         # Morphological operations to clean up
         kernel = np.ones((2, 2), np.uint8)
         cleaned = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
         
-        # Resize for better OCR (if image is too small)
-        height, width = cleaned.shape
-        if height < 500:
+        # Resize for better OCR (only if image is too small); bilinear is as good as
+        # bicubic on a cleaned binary image and much cheaper
+        if height < 300:
             scale_factor = 500 / height
             new_width = int(width * scale_factor)
-            cleaned = cv2.resize(cleaned, (new_width, 500), interpolation=cv2.INTER_CUBIC)
+            cleaned = cv2.resize(cleaned, (new_width, 500), interpolation=cv2.INTER_LINEAR)
         
-        return cleaned
+        # Download the result back into a numpy array for tesseract
+        return cleaned.get()
+    
+    def image_to_text(self, img: np.ndarray) -> str:
+        """Run OCR on a grayscale image straight from memory"""
+        # Hand tesseract the raw 8-bit pixels; SetImage would re-encode through PIL
+        pixels = np.ascontiguousarray(img, dtype=np.uint8)
+        height, width = pixels.shape
+        buffer = pixels.tobytes()
+        self.api.SetImageBytes(buffer, width, height, 1, width)
+        return self.api.GetUTF8Text()
+    
+    def images_to_lines(self, imgs: List[np.ndarray]) -> List[str]:
+        """Run OCR once over several grayscale crops stacked into a strip, one string per crop"""
+        width = max(img.shape[1] for img in imgs)
+        gap = np.full((STRIP_GAP, width), 255, np.uint8)
+        
+        # Pad each crop to the strip width with background and remember where its band starts
+        bands = []
+        offsets = []
+        top = 0
+        for img in imgs:
+            band = np.full((img.shape[0], width), 255, np.uint8)
+            band[:, :img.shape[1]] = img
+            bands.extend([band, gap])
+            offsets.append(top)
+            top += img.shape[0] + STRIP_GAP
+        strip = np.vstack(bands)
+        
+        buffer = strip.tobytes()
+        self.api.SetImageBytes(buffer, width, strip.shape[0], 1, width)
+        self.api.Recognize()
+        
+        # Assign each recognised line back to the crop its vertical centre falls in
+        lines = [[] for _ in imgs]
+        iterator = self.api.GetIterator()
+        for line in iterate_level(iterator, RIL.TEXTLINE) if iterator else []:
+            box = line.BoundingBox(RIL.TEXTLINE)
+            text = line.GetUTF8Text(RIL.TEXTLINE)
+            if box is None or not text:
+                continue
+            center = (box[1] + box[3]) // 2
+            lines[bisect_right(offsets, center) - 1].append(text.strip())
+        
+        return [' '.join(parts) for parts in lines]
     
     def extract_numbers_from_text(self, text: str) -> list:
         """Extract numeric values from OCR text"""
-        numbers = []
-        
         # Remove common OCR artifacts and normalize
-        text = text.replace('O', '0').replace('o', '0').replace('l', '1').replace('I', '1')
-        
-        # Find all numeric patterns
-        patterns = [
-            r'(\d+\.?\d*)\s*mph',
-            r'(\d+\.?\d*)\s*ft',
-            r'(\d+\.?\d*)\s*°',
-            r'(\d+\.?\d*)\s*rpm',
-            r'(\d+\.?\d*)\s*/s',
-            r'(-?\d+\.?\d*)',  # Any number (including negative)
-        ]
+        text = text.translate(self.OCR_FIXES)
         
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    numbers.append(float(match))
-                except ValueError:
-                    continue
-        
-        return numbers
+        # Single pass over the text; an optional unit suffix is consumed with its number
+        return [float(match.group('value')) for match in self.NUMBER_PATTERN.finditer(text)]
     
-    def process_oled_display(self, image_path: str) -> Tuple[Dict[str, Optional[float]], str, float]:
+    def process_oled_display(self, frame: np.ndarray) -> Tuple[Dict[str, Optional[float]], str, float]:
         """Process Full Swing KIT OLED display (4 basic values)"""
-        processed_img = self.preprocess_image(image_path)
+        processed_img = self.preprocess_array(frame, 'oled')
         
-        # Extract text
-        text = pytesseract.image_to_string(processed_img, config=self.config)
-        numbers = self.extract_numbers_from_text(text)
+        height, width = processed_img.shape
         
-        # Map to expected OLED values (adjust based on your display layout)
-        result = {
-            'ball_speed': numbers[0] if len(numbers) > 0 else None,
-            'club_head_speed': numbers[1] if len(numbers) > 1 else None,
-            'carry_distance': numbers[2] if len(numbers) > 2 else None,
-            'total_distance': numbers[3] if len(numbers) > 3 else None,
-        }
+        # Crop the known panels so tesseract skips layout analysis of the whole display
+        crops = []
+        for x, y, w, h in OLED_ROIS.values():
+            left, top = int(x * width), int(y * height)
+            crops.append(processed_img[top:top + int(h * height), left:left + int(w * width)])
+        
+        # Read all panels in a single tesseract pass
+        lines = self.images_to_lines(crops)
+        
+        result = {}
+        for field, text in zip(OLED_ROIS, lines):
+            numbers = self.extract_numbers_from_text(text)
+            result[field] = numbers[0] if numbers else None
+        
+        found = sum(value is not None for value in result.values())
+        if found == len(OLED_ROIS):
+            return result, '\n'.join(lines), 1.0
+        
+        # Panels that crop through digits come back empty, so also try the whole display
+        # and map numbers by position
+        text = self.image_to_text(processed_img)
+        numbers = self.extract_numbers_from_text(text)
+        if len(numbers) > found:
+            result = {}
+            for i, field in enumerate(OLED_ROIS):
+                result[field] = numbers[i] if len(numbers) > i else None
+            return result, text, min(1.0, len(numbers) / len(OLED_ROIS))
         
-        return result, text, len(numbers) / 4.0  # confidence score
+        return result, '\n'.join(lines), found / len(OLED_ROIS)  # confidence score
     
-    def process_ipad_display(self, image_path: str) -> Tuple[Dict[str, Optional[float]], str, float]:
+    def process_ipad_display(self, frame: np.ndarray) -> Tuple[Dict[str, Optional[float]], str, float]:
         """Process iPad display with all 14-16 values"""
-        processed_img = self.preprocess_image(image_path)
+        processed_img = self.preprocess_array(frame, 'ipad')
         
         # Extract text
-        text = pytesseract.image_to_string(processed_img, config=self.config)
+        text = self.image_to_text(processed_img)
         numbers = self.extract_numbers_from_text(text)
         
         # Map to expected iPad values (you'll need to adjust this based on layout)
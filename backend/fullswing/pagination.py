@@ -0,0 +1,9 @@
+from rest_framework.pagination import CursorPagination
+
+class SessionPagination(CursorPagination):
+    page_size = 50
+    ordering = '-created_at'
+
+class ShotPagination(CursorPagination):
+    page_size = 100
+    ordering = '-timestamp'
@@ -7,11 +7,8 @@ class ShotSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 class SessionSerializer(serializers.ModelSerializer):
-    shot_count = serializers.SerializerMethodField()
+    shot_count = serializers.IntegerField(read_only=True, default=0)
     
     class Meta:
         model = Session
         fields = ['id', 'name', 'created_at', 'notes', 'shot_count']
-    
-    def get_shot_count(self, obj):
-        return obj.shots.count()
@@ -0,0 +1,40 @@
+from celery import shared_task
+from .models import Shot
+
+@shared_task
+def run_ocr(shot_id, display_type):
+    """Run OCR on a stored shot image and save the extracted data"""
+    try:
+        shot = Shot.objects.get(id=shot_id)
+    except Shot.DoesNotExist:
+        return
+    
+    try:
+        # Imported here so web workers that only queue this task never load OpenCV/tesseract
+        from .ocr_processor import FullSwingOCR
+        
+        # Inside the try so a tesseract init failure is recorded on the shot instead of leaving it queued
+        ocr_processor = FullSwingOCR()
+        
+        # Decode the stored bytes in memory rather than handing OpenCV a path
+        with shot.image.open('rb') as image_file:
+            frame = ocr_processor.decode_image(image_file.read())
+        
+        if display_type == 'oled':
+            data, raw_text, confidence = ocr_processor.process_oled_display(frame)
+        else:
+            data, raw_text, confidence = ocr_processor.process_ipad_display(frame)
+        
+        # Update shot with extracted data
+        for field, value in data.items():
+            if value is not None and hasattr(shot, field):
+                setattr(shot, field, value)
+        
+        shot.processed = True
+        shot.confidence_score = confidence
+        shot.raw_text = raw_text
+        shot.save()
+        
+    except Exception as e:
+        shot.processing_errors = str(e)
+        shot.save()
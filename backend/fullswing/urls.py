@@ -5,4 +5,5 @@ urlpatterns = [
     path('process-image/', views.process_image, name='process_image'),
     path('sessions/', views.sessions, name='sessions'),
     path('sessions/<int:session_id>/shots/', views.session_shots, name='session_shots'),
+    path('shots/<int:shot_id>/', views.shot_detail, name='shot_detail'),
 ]
@@ -2,15 +2,17 @@ from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 from rest_framework import status
+from django.db.models import Count
 from django.utils import timezone
 from .models import Session, Shot
-from .ocr_processor import FullSwingOCR
+from .pagination import SessionPagination, ShotPagination
 from .serializers import SessionSerializer, ShotSerializer
+from .tasks import run_ocr
 
 @api_view(['POST'])
 @parser_classes([MultiPartParser, FormParser])
 def process_image(request):
-    """Process uploaded image and extract shot data"""
+    """Store uploaded image and queue OCR to extract shot data"""
     try:
         image_file = request.FILES.get('image')
         session_id = request.data.get('session_id')
@@ -21,6 +23,7 @@ def process_image(request):
         
         # Get or create session
         session = None
+        session_created = False
         if session_id:
             try:
                 session = Session.objects.get(id=session_id)
@@ -29,54 +32,40 @@ def process_image(request):
         
         if not session:
             session = Session.objects.create(name=f"Session {timezone.now().strftime('%Y-%m-%d %H:%M')}")
+            session_created = True
         
-        # Create shot record
+        # Create shot record; the image is on disk before the request returns
         shot = Shot.objects.create(session=session, image=image_file)
         
-        # Process image with OCR
-        ocr_processor = FullSwingOCR()
-        
+        # Queue OCR so the request thread isn't blocked on Tesseract
         try:
-            if display_type == 'oled':
-                data, raw_text, confidence = ocr_processor.process_oled_display(shot.image.path)
-            else:
-                data, raw_text, confidence = ocr_processor.process_ipad_display(shot.image.path)
-            
-            # Update shot with extracted data
-            for field, value in data.items():
-                if value is not None and hasattr(shot, field):
-                    setattr(shot, field, value)
-            
-            shot.processed = True
-            shot.confidence_score = confidence
-            shot.save()
-            
-            return Response({
-                'shot_id': shot.id,
-                'session_id': session.id,
-                'data': data,
-                'confidence': confidence,
-                'raw_text': raw_text
-            })
-            
-        except Exception as e:
-            shot.processing_errors = str(e)
-            shot.save()
-            return Response({
-                'error': f'Processing failed: {str(e)}',
-                'shot_id': shot.id
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            run_ocr.delay(shot.id, display_type)
+        except Exception:
+            # Don't leave a shot behind that no worker will ever process
+            shot.image.delete(save=False)
+            shot.delete()
+            if session_created:
+                session.delete()
+            raise
+        
+        return Response({
+            'shot_id': shot.id,
+            'session_id': session.id,
+            'status': 'queued'
+        }, status=status.HTTP_202_ACCEPTED)
             
     except Exception as e:
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 @api_view(['GET', 'POST'])
 def sessions(request):
-    """Get all sessions or create new session"""
+    """Get a page of sessions or create new session"""
     if request.method == 'GET':
-        sessions = Session.objects.all().order_by('-created_at')
-        serializer = SessionSerializer(sessions, many=True)
-        return Response(serializer.data)
+        sessions = Session.objects.annotate(shot_count=Count('shots'))
+        paginator = SessionPagination()
+        page = paginator.paginate_queryset(sessions, request)
+        serializer = SessionSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
     
     elif request.method == 'POST':
         serializer = SessionSerializer(data=request.data)
@@ -87,11 +76,23 @@ def sessions(request):
 
 @api_view(['GET'])
 def session_shots(request, session_id):
-    """Get all shots for a session"""
+    """Get a page of shots for a session"""
     try:
         session = Session.objects.get(id=session_id)
-        shots = session.shots.all().order_by('-timestamp')
-        serializer = ShotSerializer(shots, many=True)
-        return Response(serializer.data)
+        shots = session.shots.all()
+        paginator = ShotPagination()
+        page = paginator.paginate_queryset(shots, request)
+        serializer = ShotSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
     except Session.DoesNotExist:
         return Response({'error': 'Session not found'}, status=status.HTTP_404_NOT_FOUND)
+
+@api_view(['GET'])
+def shot_detail(request, shot_id):
+    """Get a single shot, used to poll for OCR results"""
+    try:
+        shot = Shot.objects.get(id=shot_id)
+        serializer = ShotSerializer(shot)
+        return Response(serializer.data)
+    except Shot.DoesNotExist:
+        return Response({'error': 'Shot not found'}, status=status.HTTP_404_NOT_FOUND)
@@ -2,6 +2,22 @@ import { Session, Shot } from '../types';
 
 const API_BASE = '/api';
 
+export interface Page<T> {
+  results: T[];
+  nextCursor: string | null;
+}
+
+function withCursor(url: string, cursor?: string) {
+  return cursor ? `${url}?cursor=${encodeURIComponent(cursor)}` : url;
+}
+
+async function toPage<T>(response: Response): Promise<Page<T>> {
+  const page = await response.json();
+  // `next` is an absolute URL built behind the /api prefix strip, so keep only its cursor
+  const nextCursor = page.next ? new URL(page.next).searchParams.get('cursor') : null;
+  return { results: page.results, nextCursor };
+}
+
 export const api = {
   async uploadImage(imageBlob: Blob, sessionId?: number, displayType: string = 'oled') {
     const formData = new FormData();
@@ -21,10 +37,10 @@ export const api = {
     return response.json();
   },
 
-  async getSessions(): Promise<Session[]> {
-    const response = await fetch(`${API_BASE}/sessions/`);
+  async getSessions(cursor?: string): Promise<Page<Session>> {
+    const response = await fetch(withCursor(`${API_BASE}/sessions/`, cursor));
     if (!response.ok) throw new Error('Failed to fetch sessions');
-    return response.json();
+    return toPage<Session>(response);
   },
 
   async createSession(name: string, notes?: string): Promise<Session> {
@@ -37,9 +53,15 @@ export const api = {
     return response.json();
   },
 
-  async getSessionShots(sessionId: number): Promise<Shot[]> {
-    const response = await fetch(`${API_BASE}/sessions/${sessionId}/shots/`);
+  async getSessionShots(sessionId: number, cursor?: string): Promise<Page<Shot>> {
+    const response = await fetch(withCursor(`${API_BASE}/sessions/${sessionId}/shots/`, cursor));
     if (!response.ok) throw new Error('Failed to fetch shots');
+    return toPage<Shot>(response);
+  },
+
+  async getShot(shotId: number): Promise<Shot> {
+    const response = await fetch(`${API_BASE}/shots/${shotId}/`);
+    if (!response.ok) throw new Error('Failed to fetch shot');
     return response.json();
   }
 };